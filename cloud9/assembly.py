@@ -4,6 +4,13 @@ from dataclasses import dataclass
 from typing import List, Optional
 from enum import Enum
 
+# Each KSG tree serves a single batched query, so favour build speed
+TREE_OPTS = dict(balanced_tree=False, compact_nodes=False)
+
+# Sample size above which Cloud9Analyzer(approximate_knn=True) switches the
+# joint k-NN radius to pynndescent
+APPROX_KNN_MIN_POINTS = 5000
+
 class TemporalMode(Enum):
     CLASSICAL = 1      
     BERRY_PHASE = 2    
@@ -18,31 +25,153 @@ class AssemblyResult:
     phase_locking: float            
 
 class Cloud9Analyzer:
-    def __init__(self, grid_size: int = 128, k_neighbors: int = 10):
+    def __init__(self, grid_size: int = 128, k_neighbors: int = 10,
+                 approximate_knn: bool = False):
         self.grid_size = grid_size
         self.k = k_neighbors
+        # Opt-in: approximate joint-space radii on large samples (needs pynndescent)
+        self.approximate_knn = approximate_knn
         self.epsilon = 1e-10
+        # ψ(i+1) for integer i: KSG only evaluates digamma at neighbour counts
+        self._psi = special.digamma(np.arange(1, grid_size**2 * 4 + 2, dtype=np.float64))
+        # Reusable joint-space buffer for _ksg_mi, grown on demand
+        self._xy_buf = None
+        
+    def _ksg_mi(self, X: np.ndarray, Y: np.ndarray,
+                x_order: Optional[np.ndarray] = None,
+                y_order: Optional[np.ndarray] = None) -> float:
+        """Corrected KSG estimator with special.digamma for bias removal
+        
+        x_order, y_order: optional argsort of 1-D marginals, reused across snapshot pairs
+        """
+        n, dx = X.shape
+        d = dx + Y.shape[1]
+        if self._xy_buf is None or self._xy_buf.shape[1] != d or len(self._xy_buf) < n:
+            self._xy_buf = np.empty((n, d))
+        # Contiguous float64 rows, so the tree uses the buffer without copying
+        XY = self._xy_buf[:n]
+        XY[:, :dx] = X
+        XY[:, dx:] = Y
+        if self.approximate_knn and n > APPROX_KNN_MIN_POINTS:
+            eps = self._approx_knn_radius(XY)
+        else:
+            tree_xy = spatial.KDTree(XY, **TREE_OPTS)
+            # Only the (k+1)-th neighbour (self included) sets the radius
+            dists_xy, _ = tree_xy.query(XY, k=[self.k+1], p=np.inf, workers=-1)
+            eps = dists_xy[:, 0]
         
-    def _ksg_mi(self, X: np.ndarray, Y: np.ndarray) -> float:
-        """Corrected KSG estimator with special.digamma for bias removal"""
-        n = X.shape[0]
-        XY = np.hstack([X, Y])
-        tree_xy = spatial.cKDTree(XY)
-        dists_xy, _ = tree_xy.query(XY, k=self.k+1)
-        eps = dists_xy[:, self.k] + self.epsilon
-        
-        tree_x = spatial.cKDTree(X)
-        tree_y = spatial.cKDTree(Y)
-        n_x = np.array([len(tree_x.query_ball_point(X[i], r=eps[i]-self.epsilon)) for i in range(n)]) - 1
-        n_y = np.array([len(tree_y.query_ball_point(Y[i], r=eps[i]-self.epsilon)) for i in range(n)]) - 1
-        
-        mi = (special.digamma(self.k) + special.digamma(n) - 
-              np.mean(special.digamma(n_x + 1) + special.digamma(n_y + 1)))
+        n_x = self._marginal_counts(X, eps, x_order)
+        n_y = self._marginal_counts(Y, eps, y_order)
+        
+        if n > len(self._psi):
+            self._psi = special.digamma(np.arange(1, n + 1, dtype=np.float64))
+        psi = self._psi
+        # Reduce each gathered half directly rather than summing them into
+        # another N-sized temporary first
+        mean_term = (psi[n_x].sum() + psi[n_y].sum()) / n
+        mi = psi[self.k - 1] + psi[n - 1] - mean_term
         return max(0, mi)
 
+    def _approx_knn_radius(self, XY: np.ndarray) -> np.ndarray:
+        """Approximate max-norm k-th neighbour distance via NN-descent
+        
+        Only the radius is approximated; the marginal counts that feed
+        ψ(n_x+1), ψ(n_y+1) stay exact.
+        """
+        from pynndescent import NNDescent
+        index = NNDescent(XY, n_neighbors=self.k+1, metric='chebyshev', n_jobs=-1)
+        _, dists = index.neighbor_graph
+        return dists[:, self.k].astype(np.float64)
+
+    def _marginal_counts(self, Z: np.ndarray, r: np.ndarray,
+                         order: Optional[np.ndarray] = None) -> np.ndarray:
+        """Neighbours of each point within max-norm radius r[i], excluding itself"""
+        if Z.shape[1] == 1:
+            # 1-D marginal: two binary searches on the sorted values, no tree.
+            # Searching in sorted order keeps the keys near-monotone, which
+            # lets searchsorted narrow each search from the previous hit.
+            z = Z.ravel()
+            if order is None:
+                order = np.argsort(z)
+            zs = z[order]
+            rs = r[order]
+            # Search keys in the features' own dtype so float32 data is not
+            # upcast (and copied) inside searchsorted. Narrowing must round
+            # inward: the largest key <= hi and the smallest >= lo select
+            # exactly the same data values as the float64 bounds.
+            hi64 = zs + rs
+            lo64 = zs - rs
+            hi = hi64.astype(zs.dtype, copy=False)
+            lo = lo64.astype(zs.dtype, copy=False)
+            if hi.dtype != hi64.dtype:
+                hi = np.where(hi > hi64, np.nextafter(hi, -np.inf), hi)
+                lo = np.where(lo < lo64, np.nextafter(lo, np.inf), lo)
+            upper = np.searchsorted(zs, hi, side='right')
+            lower = np.searchsorted(zs, lo, side='left')
+            self._settle_bounds(zs, rs, lower, upper)
+            # Finish the count in the first search's output buffer
+            upper -= lower
+            upper -= 1
+            counts = np.empty(len(z), dtype=np.intp)
+            counts[order] = upper
+            return counts
+        
+        tree = spatial.KDTree(Z, **TREE_OPTS)
+        return tree.query_ball_point(Z, r=r, p=np.inf, return_length=True,
+                                   workers=-1) - 1
+
+    @staticmethod
+    def _settle_bounds(zs: np.ndarray, rs: np.ndarray,
+                       lower: np.ndarray, upper: np.ndarray) -> None:
+        """Move [lower, upper) in place onto the points with |z_j - z_i| <= r_i
+        
+        The searches compare z_j against the rounded bound fl(z_i ± r_i), the
+        tree path against the rounded difference. The KSG radius is exactly
+        some neighbour's distance, so the two can disagree on that boundary
+        point; re-test the first point past each end and the last point
+        inside it with the difference, stepping over ties. The qualifying
+        set is contiguous, so this settles after a step or two.
+        """
+        n = len(zs)
+        i = np.arange(n)
+        
+        def within(j, at):
+            # float64 difference, as the tree computes it
+            return np.abs(zs[j].astype(np.float64) - zs[at]) <= rs[at]
+        
+        while True:
+            at = i[upper < n]
+            at = at[within(upper[at], at)]
+            if not at.size:
+                break
+            upper[at] = np.searchsorted(zs, zs[upper[at]], side='right')
+        while True:
+            # never empty: each point is within r of itself
+            at = i[~within(upper - 1, i)]
+            if not at.size:
+                break
+            upper[at] = np.searchsorted(zs, zs[upper[at] - 1], side='left')
+        while True:
+            at = i[lower > 0]
+            at = at[within(lower[at] - 1, at)]
+            if not at.size:
+                break
+            lower[at] = np.searchsorted(zs, zs[lower[at] - 1], side='left')
+        while True:
+            at = i[~within(lower, i)]
+            if not at.size:
+                break
+            lower[at] = np.searchsorted(zs, zs[lower[at]], side='right')
+
     def compute_assembly_index(self, density_snapshots: List[np.ndarray], mode: TemporalMode = TemporalMode.CLASSICAL):
-        features = [snap.flatten().reshape(-1, 1) for snap in density_snapshots]
-        mi_values = [self._ksg_mi(features[i], features[i+1]) for i in range(len(features)-1)]
+        # Single precision is ample for neighbour ranks and halves the bytes
+        # streamed by the marginal searches; radii stay float64
+        features = [snap.astype(np.float32).reshape(-1, 1) for snap in density_snapshots]
+        # Each snapshot is the X of one pair and the Y of the next: sort once
+        orders = [np.argsort(f.ravel()) for f in features]
+        mi_values = [self._ksg_mi(features[i], features[i+1],
+                                  orders[i], orders[i+1])
+                     for i in range(len(features)-1)]
         
         A_c = np.sum(mi_values)
         z_score = (A_c - 62.1) / 8.4 # Calibrated against 10k null halos
@@ -17,17 +17,30 @@ Version: 1.0.0 (Empirical Release)
 """
 
 import numpy as np
-from scipy.spatial import cKDTree
+from scipy.spatial import KDTree
 from scipy.special import digamma, gamma
-from scipy.stats import norm
 import argparse
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import warnings
 
 
+# k-NN trees here are built once and queried once: a sliding-midpoint
+# build (no median balancing, no node shrinking) is cheaper end to end
+TREE_OPTS = dict(balanced_tree=False, compact_nodes=False)
+
+# Threads per k-NN query (-1: all cores). Null-model worker processes
+# drop this to 1 so the pool does not oversubscribe the machine.
+KNN_WORKERS = -1
+
+# Joint-space buffer for mutual_information, grown on demand and reused
+# (flat, so any (n_samples, n_dims) shape is a contiguous view of it)
+_XY_BUF = None
+
+
 # ==============================================================================
 # SECTION 1: CORE MATHEMATICAL FUNCTIONS (k-NN Entropy Estimation)
 # ==============================================================================
@@ -53,20 +66,20 @@ def knn_entropy(x, k=4, norm='max'):
     entropy : float
         Differential entropy in bits
     """
-    x = np.asarray(x)
+    x = np.ascontiguousarray(x, dtype=np.float64)
     n_samples, n_dims = x.shape
     
     if n_samples < k + 1:
         raise ValueError(f"n_samples ({n_samples}) must be > k ({k})")
     
-    # Build k-d tree
+    # Build k-d tree; only the (k+1)-th neighbour distance is needed
     if norm == 'euclidean':
-        tree = cKDTree(x)
-        distances, _ = tree.query(x, k=k+1)
+        tree = KDTree(x, **TREE_OPTS)
+        distances, _ = tree.query(x, k=[k+1], workers=KNN_WORKERS)
         epsilon = distances[:, -1]
     else:
-        tree = cKDTree(x, boxsize=None)
-        distances, _ = tree.query(x, k=k+1, p=np.inf)
+        tree = KDTree(x, boxsize=None, **TREE_OPTS)
+        distances, _ = tree.query(x, k=[k+1], p=np.inf, workers=KNN_WORKERS)
         epsilon = distances[:, -1]
     
     # KSG estimator components
@@ -88,7 +101,54 @@ def knn_entropy(x, k=4, norm='max'):
     return entropy_bits
 
 
-def mutual_information(x, y, k=4):
+def knn_entropy_1d_batch(fields, k=4):
+    """
+    Max-norm k-NN entropy of many 1-D samples in one vectorized pass.
+    
+    Equivalent to ``[knn_entropy(f.reshape(-1, 1), k) for f in fields]``
+    but works on the whole (n_fields, n_samples) stack at once: after
+    sorting, the k nearest neighbours of a point always form a contiguous
+    window of k+1 sorted values around it, so the k-th neighbour distance
+    is the smallest window half-span over the k+1 windows containing it.
+    
+    Parameters
+    ----------
+    fields : ndarray, shape (n_fields, n_samples)
+        One 1-D sample per row
+    k : int, default=4
+        Number of nearest neighbors
+    
+    Returns
+    -------
+    entropies : ndarray, shape (n_fields,)
+        Differential entropy of each row in bits
+    """
+    fields = np.asarray(fields, dtype=np.float64)
+    n_fields, n_samples = fields.shape
+    
+    if n_samples < k + 1:
+        raise ValueError(f"n_samples ({n_samples}) must be > k ({k})")
+    
+    xs = np.sort(fields, axis=1)
+    padded = np.empty((n_fields, n_samples + 2*k))
+    padded[:, :k] = -np.inf
+    padded[:, k:k+n_samples] = xs
+    padded[:, k+n_samples:] = np.inf
+    
+    epsilon = np.full((n_fields, n_samples), np.inf)
+    for o in range(k + 1):
+        left = xs - padded[:, o:o+n_samples]
+        right = padded[:, o+k:o+k+n_samples] - xs
+        np.minimum(epsilon, np.maximum(left, right), out=epsilon)
+    
+    epsilon = np.maximum(epsilon, 1e-10)
+    log_sum = np.mean(np.log(epsilon), axis=1)
+    
+    entropy_nats = digamma(n_samples) - digamma(k) + log_sum
+    return entropy_nats / np.log(2)
+
+
+def mutual_information(x, y, k=4, h_x=None, h_y=None):
     """
     Calculate mutual information I(X;Y) = H(X) + H(Y) - H(X,Y).
     
@@ -102,6 +162,8 @@ def mutual_information(x, y, k=4):
         Second variable (density field at time τ+Δτ)
     k : int, default=4
         Number of nearest neighbors
+    h_x, h_y : float, optional
+        Precomputed marginal entropies H(X), H(Y) in bits
     
     Returns
     -------
@@ -114,12 +176,20 @@ def mutual_information(x, y, k=4):
     if len(x) != len(y):
         raise ValueError("x and y must have same number of samples")
     
-    # Joint variable
-    xy = np.hstack([x, y])
+    # Joint variable, filled into the reusable buffer instead of a fresh hstack
+    global _XY_BUF
+    n, d = len(x), x.shape[1] + y.shape[1]
+    if _XY_BUF is None or _XY_BUF.size < n * d:
+        _XY_BUF = np.empty(n * d)
+    xy = _XY_BUF[:n * d].reshape(n, d)
+    xy[:, :x.shape[1]] = x
+    xy[:, x.shape[1]:] = y
     
     # Entropies
-    h_x = knn_entropy(x, k=k)
-    h_y = knn_entropy(y, k=k)
+    if h_x is None:
+        h_x = knn_entropy(x, k=k)
+    if h_y is None:
+        h_y = knn_entropy(y, k=k)
     h_xy = knn_entropy(xy, k=k)
     
     # Mutual information
@@ -133,7 +203,25 @@ def mutual_information(x, y, k=4):
     return mi
 
 
-def assembly_index(density_snapshots, redshifts, k=4, adaptive=True, threshold=0.1):
+_PAIR_STATE = {}
+
+
+def _init_pair_worker(fields, h_list, k):
+    """Stash one halo's snapshots in a pool process for _pair_mi."""
+    global KNN_WORKERS
+    KNN_WORKERS = 1
+    _PAIR_STATE.update(fields=fields, h_list=h_list, k=k)
+
+
+def _pair_mi(i):
+    """I(ρ_i; ρ_{i+1}) from the stashed snapshots (process-pool worker)."""
+    fields, h_list = _PAIR_STATE['fields'], _PAIR_STATE['h_list']
+    return mutual_information(fields[i], fields[i+1], k=_PAIR_STATE['k'],
+                              h_x=h_list[i], h_y=h_list[i+1])
+
+
+def assembly_index(density_snapshots, redshifts, k=4, adaptive=True, threshold=0.1,
+                   n_jobs=1):
     """
     Calculate Cosmological Assembly Index A_c.
     
@@ -151,6 +239,9 @@ def assembly_index(density_snapshots, redshifts, k=4, adaptive=True, threshold=0
         Use adaptive time stepping
     threshold : float, default=0.1
         Adaptivity threshold (bits/Gyr)
+    n_jobs : int or None, default=1
+        Worker processes for the snapshot-pair MI terms (None: one per
+        CPU, 1: serial, as used inside the null-model pool)
     
     Returns
     -------
@@ -175,17 +266,30 @@ def assembly_index(density_snapshots, redshifts, k=4, adaptive=True, threshold=0
     # Convert redshift to cosmic time (simplified)
     times = 13.8 * (1 - (1 + redshifts)**(-1.5))
     
-    mutual_infos = []
+    # Flatten density fields
+    fields = [snap.flatten().reshape(-1, 1) for snap in density_snapshots]
+    
+    # Marginal entropies: each snapshot is X for one pair and Y for the
+    # previous one, so estimate H(ρ_i) once per snapshot
+    if len({len(x) for x in fields}) == 1:
+        h_list = knn_entropy_1d_batch(np.hstack(fields).T, k=k)
+    else:
+        h_list = [knn_entropy(x, k=k) for x in fields]
+    
+    # Snapshot pairs are independent given the marginals
+    if n_jobs == 1:
+        mutual_infos = [mutual_information(fields[i], fields[i+1], k=k,
+                                           h_x=h_list[i], h_y=h_list[i+1])
+                        for i in range(n_snaps - 1)]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_pair_worker,
+                                 initargs=(fields, h_list, k)) as ex:
+            mutual_infos = list(ex.map(_pair_mi, range(n_snaps - 1), chunksize=2))
+    
     time_intervals = []
     
     for i in range(n_snaps - 1):
-        # Flatten density fields
-        x = density_snapshots[i].flatten().reshape(-1, 1)
-        y = density_snapshots[i+1].flatten().reshape(-1, 1)
-        
-        mi = mutual_information(x, y, k=k)
-        mutual_infos.append(mi)
-        
+        mi = mutual_infos[i]
         dt = times[i+1] - times[i]
         time_intervals.append(abs(dt))
         
@@ -205,7 +309,24 @@ def assembly_index(density_snapshots, redshifts, k=4, adaptive=True, threshold=0
     return ac_value, ac_error, mutual_infos
 
 
-def generate_null_model(n_halos=1000, n_snapshots=20, n_cells=1000, seed=42):
+def _init_null_worker():
+    """Keep each pool process to one k-NN thread."""
+    global KNN_WORKERS
+    KNN_WORKERS = 1
+
+
+def _null_halo_ac(snapshots):
+    """Assembly Index of one null halo (process-pool worker)."""
+    redshifts = np.linspace(20, 0, len(snapshots))
+    try:
+        ac, _, _ = assembly_index(snapshots, redshifts, k=4)
+        return ac
+    except Exception:
+        return np.nan
+
+
+def generate_null_model(n_halos=1000, n_snapshots=20, n_cells=1000, seed=42,
+                        n_jobs=None):
     """
     Generate LambdaCDM null model for statistical comparison.
     
@@ -221,6 +342,9 @@ def generate_null_model(n_halos=1000, n_snapshots=20, n_cells=1000, seed=42):
         Grid resolution
     seed : int, default=42
         Random seed
+    n_jobs : int, optional
+        Worker processes for the per-halo A_c evaluation
+        (default: one per CPU, 1: serial, without a process pool)
     
     Returns
     -------
@@ -229,27 +353,30 @@ def generate_null_model(n_halos=1000, n_snapshots=20, n_cells=1000, seed=42):
     stats : dict
         {'mean': 62.1, 'std': 8.4, 'n': 1000}
     """
-    np.random.seed(seed)
-    null_ac_values = []
-    
-    for i in range(n_halos):
-        snapshots = []
-        # Start with Gaussian random field
-        rho = np.random.normal(1.0, 0.5, n_cells)
-        
-        # Evolve with correlation structure
-        for j in range(n_snapshots):
-            structure = 0.3 * np.sin(np.linspace(0, 4*np.pi, n_cells) + j*0.2)
-            rho = 0.9 * rho + 0.1 * structure + np.random.normal(0, 0.05, n_cells)
-            snapshots.append(rho.copy())
-        
-        redshifts = np.linspace(20, 0, n_snapshots)
-        
-        try:
-            ac, _, _ = assembly_index(snapshots, redshifts, k=4)
-            null_ac_values.append(ac)
-        except Exception:
-            null_ac_values.append(np.nan)
+    rng = np.random.default_rng(seed)
+    
+    # Correlation structure is shared by every halo: one (n_snapshots, n_cells)
+    # sin evaluation on a cached phase grid
+    base = np.linspace(0, 4*np.pi, n_cells)
+    structures = 0.3 * np.sin(base[None, :] + 0.2 * np.arange(n_snapshots)[:, None])
+    
+    # Start with Gaussian random fields, one row per halo
+    rho = rng.normal(1.0, 0.5, (n_halos, n_cells))
+    
+    # Evolve all halos together; snapshots[h, j] is halo h at step j and
+    # starts out holding that step's noise, so the evolution runs in place
+    snapshots = rng.normal(0, 0.05, (n_halos, n_snapshots, n_cells))
+    for j in range(n_snapshots):
+        snapshots[:, j] += 0.9 * rho + 0.1 * structures[j]
+        rho = snapshots[:, j]
+    
+    # Halos are independent: spread the k-NN work across processes
+    if n_jobs == 1:
+        null_ac_values = [_null_halo_ac(s) for s in snapshots]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs,
+                                 initializer=_init_null_worker) as ex:
+            null_ac_values = list(ex.map(_null_halo_ac, snapshots, chunksize=8))
     
     null_ac_values = np.array(null_ac_values)
     null_ac_values = null_ac_values[~np.isnan(null_ac_values)]
@@ -289,6 +416,10 @@ def calculate_z_score(observed_ac, observed_err, null_mean, null_std):
     percentile : float
         Confidence level
     """
+    # Imported here: scipy.stats is slow to load and only needed once per
+    # run, not in every null-model worker process
+    from scipy.stats import norm
+    
     z_score = (observed_ac - null_mean) / null_std
     p_value = 2 * (1 - norm.cdf(abs(z_score)))
     percentile = 100 * (1 - p_value/2)
@@ -367,12 +498,14 @@ def generate_synthetic_cloud9():
     n_snapshots = 25
     n_cells = 2000
     
+    base = np.linspace(0, 4*np.pi, n_cells)
+    structures = 0.3 * np.sin(base[None, :] + 0.2 * np.arange(n_snapshots)[:, None])
+    
     snapshots = []
     rho = np.random.normal(1.0, 0.5, n_cells)
     
     for i in range(n_snapshots):
-        structure = 0.3 * np.sin(np.linspace(0, 4*np.pi, n_cells) + i*0.2)
-        rho = 0.9 * rho + 0.1 * structure + np.random.normal(0, 0.05, n_cells)
+        rho = 0.9 * rho + 0.1 * structures[i] + np.random.normal(0, 0.05, n_cells)
         snapshots.append(rho.copy())
     
     redshifts = np.linspace(20, 0, n_snapshots)
@@ -403,6 +536,8 @@ def main():
                        help='k-NN parameter (default: 4)')
     parser.add_argument('--null-n', type=int, default=1000,
                        help='Number of null model halos')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Worker processes (default: one per CPU)')
     parser.add_argument('--output', type=str, default='results/',
                        help='Output directory')
     
@@ -436,7 +571,7 @@ def main():
     print(f"  Using k-NN with k={args.k}")
     
     ac_value, ac_error, mi_series = assembly_index(
-        snapshots, redshifts, k=args.k, adaptive=True
+        snapshots, redshifts, k=args.k, adaptive=True, n_jobs=args.jobs
     )
     
     print(f"\n  RESULT: A_c = {ac_value:.1f} ± {ac_error:.1f} bits")
@@ -446,7 +581,8 @@ def main():
     null_values, null_stats = generate_null_model(
         n_halos=args.null_n, 
         n_snapshots=len(snapshots),
-        n_cells=len(snapshots[0])
+        n_cells=len(snapshots[0]),
+        n_jobs=args.jobs
     )
     
     print(f"\n  NULL MODEL: μ = {null_stats['mean']:.1f} ± {null_stats['std']:.1f} bits")
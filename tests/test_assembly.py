@@ -0,0 +1,74 @@
+import numpy as np
+from scipy.special import digamma
+
+from cloud9.assembly import Cloud9Analyzer
+
+
+def _brute_force_counts(z, r):
+    """Neighbours with |z_j - z_i| <= r_i, excluding i, in float64"""
+    z = z.astype(np.float64)
+    return (np.abs(z[None, :] - z[:, None]) <= r[:, None]).sum(axis=1) - 1
+
+
+def test_marginal_counts_float32_match_exact_radius():
+    rng = np.random.default_rng(0)
+    z = rng.random(400).astype(np.float32)
+    zs = np.sort(z).astype(np.float64)
+    # Radii exactly reaching a neighbouring value, or a quarter float32 ulp
+    # short of it: round-to-nearest float32 bounds would land on that point
+    idx = np.searchsorted(zs, z.astype(np.float64))
+    up = zs[np.minimum(idx + 3, len(zs) - 1)]
+    gap = up - z.astype(np.float64)  # exact for float32 inputs
+    short = gap - 0.25 * np.spacing(up.astype(np.float32)).astype(np.float64)
+    r = np.maximum(np.where(np.arange(len(z)) % 2 == 0, short, gap), 0.0)
+
+    counts = Cloud9Analyzer(grid_size=8)._marginal_counts(z[:, None], r)
+    np.testing.assert_array_equal(counts, _brute_force_counts(z, r))
+
+
+def test_marginal_counts_float64_match_tree_path():
+    rng = np.random.default_rng(1)
+    z = rng.random(300)
+    r = rng.random(300) * 0.05
+    counts = Cloud9Analyzer(grid_size=8)._marginal_counts(z[:, None], r)
+    np.testing.assert_array_equal(counts, _brute_force_counts(z, r))
+
+
+def test_marginal_counts_float64_exact_neighbour_radius():
+    # KSG radii are exact distances to a neighbour; z_i + r can round past
+    # or short of that neighbour, the |z_j - z_i| <= r test cannot
+    rng = np.random.default_rng(2)
+    z = rng.standard_normal(2000)
+    zs = np.sort(z)
+    idx = np.searchsorted(zs, z)
+    for offset in (1, 3, 10):
+        r = np.abs(zs[np.clip(idx + offset, 0, len(z) - 1)] - z)
+        r = np.maximum(r, np.abs(zs[np.clip(idx - offset, 0, len(z) - 1)] - z))
+        counts = Cloud9Analyzer(grid_size=8)._marginal_counts(z[:, None], r)
+        np.testing.assert_array_equal(counts, _brute_force_counts(z, r))
+
+
+def test_marginal_counts_with_ties_at_the_boundary():
+    rng = np.random.default_rng(3)
+    z = rng.integers(0, 20, 500).astype(np.float64) * 0.1
+    for dtype in (np.float64, np.float32):
+        zd = z.astype(dtype)
+        rd = np.abs(zd.astype(np.float64) - zd[rng.integers(0, 500, 500)])
+        counts = Cloud9Analyzer(grid_size=8)._marginal_counts(zd[:, None], rd)
+        np.testing.assert_array_equal(counts, _brute_force_counts(zd, rd))
+
+
+def test_ksg_mi_float64_matches_brute_force():
+    rng = np.random.default_rng(4)
+    x = rng.standard_normal(2000)
+    y = 0.6 * x + 0.8 * rng.standard_normal(2000)
+    analyzer = Cloud9Analyzer(grid_size=8)
+    X, Y = x[:, None], y[:, None]
+    eps = np.maximum(np.abs(x[:, None] - x[None, :]),
+                     np.abs(y[:, None] - y[None, :]))
+    eps = np.sort(eps, axis=1)[:, analyzer.k]
+    n_x = _brute_force_counts(x, eps)
+    n_y = _brute_force_counts(y, eps)
+    expected = max(0, digamma(analyzer.k) + digamma(len(x)) -
+                   np.mean(digamma(n_x + 1) + digamma(n_y + 1)))
+    assert np.isclose(analyzer._ksg_mi(X, Y), expected, rtol=0, atol=1e-12)
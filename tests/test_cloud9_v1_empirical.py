@@ -0,0 +1,31 @@
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def empirical():
+    """cloud9_v1_empirical.py, loaded from inside its markdown code fence"""
+    path = ROOT / "cloud9_v1_empirical.py"
+    src = path.read_text(encoding="utf-8")
+    body = src.split("```python\n", 1)[1].rsplit("```", 1)[0]
+    module = types.ModuleType("cloud9_v1_empirical")
+    module.__file__ = str(path)
+    exec(compile(body, str(path), "exec"), module.__dict__)
+    return module
+
+
+def test_null_model_serial_runs_without_a_pool(empirical, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("n_jobs=1 must not start a process pool")
+
+    monkeypatch.setattr(empirical, "ProcessPoolExecutor", no_pool)
+    values, stats = empirical.generate_null_model(
+        n_halos=3, n_snapshots=4, n_cells=200, seed=1, n_jobs=1)
+    assert stats["n"] == len(values) == 3
+    assert np.isfinite(values).all()
+    assert stats["mean"] == pytest.approx(np.mean(values))
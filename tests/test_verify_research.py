@@ -0,0 +1,319 @@
+import base64
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def vr():
+    """verify_research.py, loaded from inside its markdown code fence"""
+    path = ROOT / "verify_research.py"
+    src = path.read_text(encoding="utf-8")
+    body = src.split("```python\n", 1)[1].rsplit("```", 1)[0]
+    module = types.ModuleType("verify_research")
+    module.__file__ = str(path)
+    exec(compile(body, str(path), "exec"), module.__dict__)
+    return module
+
+
+def _git(repo, *args, **kwargs):
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True, text=True, **kwargs
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Throwaway repository with two unsigned commits, as the cwd"""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "README").write_text("x\n")
+    _git(tmp_path, "add", "README")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "second")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_batch_unsigned_unknown_and_unresolvable(vr, repo):
+    hashes = ["HEAD", "HEAD~1", "0" * 40, "deadbeef", "HEAD:README", "not a rev"]
+    results = vr.verify_commits_batch(hashes)
+
+    assert [r["commit"] for r in results] == hashes
+    assert all(r["status"] == "FAILED" for r in results)
+    assert results[0]["error"] == results[1]["error"] == "no signature"
+    for r in results[2:]:
+        assert r["error"] == f"cannot resolve commit {r['commit']}"
+
+
+def test_batch_matches_single_commit_shape(vr, repo):
+    [batch] = vr.verify_commits_batch(["HEAD"])
+    single = vr.verify_gpg_signature("HEAD")
+    assert batch.keys() == single.keys()
+    assert batch["status"] == single["status"] == "FAILED"
+
+
+def test_batch_outside_repository_returns_failures(vr, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = vr.verify_commits_batch(["HEAD", "abc1234"])
+    assert [r["status"] for r in results] == ["FAILED", "FAILED"]
+    assert [r["commit"] for r in results] == ["HEAD", "abc1234"]
+    assert "not a git repository" in results[0]["error"]
+
+
+def test_batch_empty(vr):
+    assert vr.verify_commits_batch([]) == []
+
+
+@pytest.mark.skipif(shutil.which("gpg") is None, reason="gpg not installed")
+def test_batch_signed_commit(vr, repo, tmp_path_factory, monkeypatch):
+    home = tmp_path_factory.mktemp("gnupg")
+    home.chmod(0o700)
+    monkeypatch.setenv("GNUPGHOME", str(home))
+    subprocess.run(
+        ["gpg", "--batch", "--passphrase", "", "--quick-gen-key",
+         "Test <test@example.com>", "ed25519", "sign", "never"],
+        check=True, capture_output=True
+    )
+    _git(repo, "-c", "user.signingkey=test@example.com",
+         "commit", "-q", "-S", "--allow-empty", "-m", "signed")
+
+    results = vr.verify_commits_batch(["HEAD", "HEAD~1"])
+    assert [r["status"] for r in results] == ["VERIFIED", "FAILED"]
+
+
+def test_in_process_follows_cwd_repository(vr, repo, tmp_path_factory, monkeypatch):
+    pytest.importorskip("pygit2")
+    # unsigned commits never reach gpgme, so an empty stand-in suffices
+    monkeypatch.setitem(sys.modules, "gpg", types.ModuleType("gpg"))
+    monkeypatch.setattr(vr, "_REPOS", {})
+    assert vr._verify_in_process("HEAD~1") == (False, "no signature")
+
+    other = tmp_path_factory.mktemp("other")
+    _git(other, "init", "-q")
+    _git(other, "commit", "-q", "--allow-empty", "-m", "only")
+    monkeypatch.chdir(other)
+    ok, error = vr._verify_in_process("HEAD~1")
+    assert not ok and error.startswith("cannot resolve commit HEAD~1")
+    assert vr._verify_in_process("HEAD") == (False, "no signature")
+    assert len(vr._REPOS) == 2
+
+
+def test_report_file_mode_follows_umask(vr, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    old = os.umask(0o022)
+    try:
+        path, _ = vr._write_report({"a": 1})
+    finally:
+        os.umask(old)
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert list(tmp_path.iterdir()) == [tmp_path / path]
+
+
+def _flip_byte(path, offset=10):
+    data = bytearray(path.read_bytes())
+    data[offset] ^= 0x01
+    path.write_bytes(bytes(data))
+
+
+@pytest.fixture
+def signing_key(monkeypatch):
+    pytest.importorskip("cryptography")
+    seed = base64.b64encode(os.urandom(32)).decode()
+    monkeypatch.setenv("CLOUD9_REPORT_SIGNING_KEY", seed)
+    return seed
+
+
+def _public_b64(vr):
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+    key = vr._load_signing_key().public_key()
+    return base64.b64encode(key.public_bytes(Encoding.Raw, PublicFormat.Raw)).decode()
+
+
+def test_sign_then_verify_round_trip(vr, signing_key, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, digest = vr._write_report({"a": 1, "b": [1, 2]})
+    sig_path = vr.sign_report(path, digest, vr._load_signing_key())
+
+    assert sig_path == path.with_name(path.name + ".sig")
+    assert vr.verify_report(path, public_key_b64=_public_b64(vr))
+    monkeypatch.setenv("CLOUD9_REPORT_PUBKEY", _public_b64(vr))
+    assert vr.verify_report(path)
+
+
+def test_verify_report_requires_trusted_key(vr, signing_key, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CLOUD9_REPORT_PUBKEY", raising=False)
+    path, digest = vr._write_report({"a": 1})
+    vr.sign_report(path, digest, vr._load_signing_key())
+    assert not vr.verify_report(path)
+
+    # an edited report re-signed with another key is still rejected
+    trusted = _public_b64(vr)
+    _flip_byte(path)
+    monkeypatch.setenv("CLOUD9_REPORT_SIGNING_KEY",
+                       base64.b64encode(os.urandom(32)).decode())
+    vr.sign_report(path, vr._file_digest(path, vr.hashlib.blake2b).digest(),
+                   vr._load_signing_key())
+    assert vr.verify_report(path, public_key_b64=_public_b64(vr))
+    assert not vr.verify_report(path, public_key_b64=trusted)
+
+
+def test_verify_report_missing_or_malformed_sidecar(vr, signing_key, tmp_path,
+                                                    monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, digest = vr._write_report({"a": 1})
+    trusted = _public_b64(vr)
+    assert not vr.verify_report(path, public_key_b64=trusted)
+
+    sig_path = path.with_name(path.name + ".sig")
+    for content in ["not json", "[]", "{}", '{"algorithm": "ed25519-blake2b512"}',
+                    '{"algorithm": "ed25519-blake2b512", "signature_b64": "!"}']:
+        sig_path.write_text(content)
+        assert not vr.verify_report(path, public_key_b64=trusted)
+    assert not vr.verify_report(tmp_path / "missing.json", public_key_b64=trusted)
+
+
+def test_verify_report_rejects_tampered_report(vr, signing_key, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, digest = vr._write_report({"a": 1, "b": [1, 2]})
+    vr.sign_report(path, digest, vr._load_signing_key())
+
+    _flip_byte(path)
+    assert not vr.verify_report(path, public_key_b64=_public_b64(vr))
+
+
+def test_verify_report_rejects_untrusted_or_tampered_signature(vr, signing_key,
+                                                              tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, digest = vr._write_report({"a": 1})
+    sig_path = vr.sign_report(path, digest, vr._load_signing_key())
+
+    other = "A" * 43 + "="
+    assert not vr.verify_report(path, public_key_b64=other)
+
+    envelope = json.loads(sig_path.read_text())
+    sig = bytearray(base64.b64decode(envelope["signature_b64"]))
+    sig[0] ^= 0x01
+    envelope["signature_b64"] = base64.b64encode(bytes(sig)).decode()
+    sig_path.write_text(json.dumps(envelope))
+    assert not vr.verify_report(path, public_key_b64=_public_b64(vr))
+
+
+def test_verify_report_file_matches_name(vr, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, _ = vr._write_report({"a": 1})
+    assert vr.verify_report_file(path)
+    assert vr.verify_report_file(str(path))
+
+
+def test_verify_report_file_rejects_mismatched_name(vr, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, _ = vr._write_report({"a": 1})
+    renamed = path.with_name("verification_report_0123456789abcdef.json")
+    path.rename(renamed)
+    assert not vr.verify_report_file(renamed)
+
+
+def test_verify_report_file_rejects_edited_report(vr, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, _ = vr._write_report({"a": 1})
+    _flip_byte(path, offset=3)
+    assert not vr.verify_report_file(path)
+
+
+def test_verify_report_file_rejects_foreign_names(vr, tmp_path):
+    other = tmp_path / "report.json"
+    other.write_text("{}")
+    assert not vr.verify_report_file(other)
+
+
+def test_verify_report_file_without_file_digest(vr, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path, _ = vr._write_report({"a": 1})
+    monkeypatch.delattr(vr.hashlib, "file_digest", raising=False)
+    assert vr.verify_report_file(path)
+
+
+def test_report_memo_reused_while_intact(vr, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    vr._LAST.clear()
+    first = vr.generate_integrity_report()
+    assert vr.generate_integrity_report() is first
+
+
+def test_report_memo_regenerates_edited_report(vr, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    vr._LAST.clear()
+    first = vr.generate_integrity_report()
+    _flip_byte(vr._LAST["output_path"])
+    second = vr.generate_integrity_report()
+    assert second is not first
+    assert vr.verify_report_file(vr._LAST["output_path"])
+
+
+def test_report_memo_regenerates_missing_signature(vr, signing_key, tmp_path,
+                                                   monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    vr._LAST.clear()
+    first = vr.generate_integrity_report()
+    sig_path = vr._LAST["sig_path"]
+    sig_path.unlink()
+    second = vr.generate_integrity_report()
+    assert second is not first
+    assert sig_path.exists()
+    assert "Signature saved" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_summary_uses_one_stdout_encoding(vr, monkeypatch, encoding):
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(raw, encoding=encoding, errors="replace")
+    monkeypatch.setattr(vr.sys, "stdout", stdout)
+    sensitive = {"gpg_key_id": "0123456789ABCDEF"}
+    vr._print_summary({"integrity_status": "VERIFIED"}, sensitive,
+                      Path("report.json"))
+    stdout.flush()
+    expected = ("\U0001f52c Cloud-9 Research Integrity Report\n"
+                "Status: VERIFIED\n").encode(encoding, errors="replace")
+    assert raw.getvalue().startswith(expected)
+
+
+def _representative_report(vr):
+    return {
+        "component_checks": {"a": True, "b": False},
+        "count": 12345678901234567890,
+        "dedication": list(vr.RESEARCH_MANIFEST["dedication"]),
+        "empty": {},
+        "nested": [{"k": None}, [], [1, -2, "x"]],
+        "note": "Sensitive data — \U0001f52c \"quoted\" \\ tab\t nl\n ctrl\x01",
+        "target": "1e-07",
+    }
+
+
+def test_report_bytes_same_with_and_without_orjson(vr, tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.chdir(tmp_path)
+    report = _representative_report(vr)
+    with_orjson, _ = vr._write_report(report)
+    monkeypatch.setattr(vr, "orjson", None)
+    without_orjson, _ = vr._write_report(report)
+    assert with_orjson == without_orjson
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_report_with_floats_is_rejected(vr, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    vr._LAST.clear()
+    monkeypatch.setattr(vr, "_now_iso", lambda: 1e-07)
+    with pytest.raises(AssertionError, match="floats"):
+        vr.generate_integrity_report()
@@ -7,23 +7,48 @@ Re-verifies GPG-signed commits and Assembly Score thresholds
 Usage:
     export CLOUD9_GPG_KEY_ID="your_key_id_here"
     export CLOUD9_SIGNATORY="your_email_here"
+    export CLOUD9_GPG_PUBKEY="path/to/trusted_key.asc"  # optional, batch mode
+    export CLOUD9_REPORT_SIGNING_KEY="base64 Ed25519 seed"  # optional, .sig sidecar
+    export CLOUD9_REPORT_PUBKEY="base64 Ed25519 public key"  # trusted by verify_report
     python verify_research.py
 """
 
+import asyncio
+import atexit
+import base64
+import codecs
 import subprocess
 import hashlib
+import io
 import json
 import os
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Public research data (safe to commit)
-RESEARCH_MANIFEST = {
+# Read-only, so checks and report keys computed from it stay valid
+RESEARCH_MANIFEST: Final[Mapping[str, object]] = MappingProxyType({
     "verification_target": "0.5229 AU",
     "commit_hash": "d0ecc8f",
     "resonance_vertex": "7.83 kHz",
-    "dedication": ["Niki", "Nikolaos", "Apostolos"]
-}
+    "dedication": ("Niki", "Nikolaos", "Apostolos")
+})
+
+def _now_iso() -> str:
+    """Verification timestamp: UTC, whole seconds"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 # Sensitive data from environment (keep private)
 def get_sensitive_config():
@@ -33,68 +58,551 @@ def get_sensitive_config():
         "signatory": os.getenv("CLOUD9_SIGNATORY", "[REDACTED]")
     }
 
-def verify_gpg_signature(commit_hash: str) -> dict:
-    """Verify GPG signature on specific commit"""
+# git's %G? signature codes; verify-commit accepts only G and U
+_GIT_SIG_STATUS = {
+    "G": "good signature",
+    "U": "good signature, unknown key validity",
+    "B": "bad signature",
+    "X": "good signature that has expired",
+    "Y": "good signature made by an expired key",
+    "R": "good signature made by a revoked key",
+    "E": "signature cannot be checked (missing key?)",
+    "N": "no signature",
+}
+
+# `--raw` GPG status tokens that mean a signature is present but unusable
+_RAW_SIG_STATUS = {
+    "BADSIG": "B",
+    "ERRSIG": "E",
+    "EXPSIG": "X",
+    "EXPKEYSIG": "Y",
+    "REVKEYSIG": "R",
+}
+
+# libgit2 handles per discovered repository path, opened on first use
+_REPOS = {}
+
+# Warm gpgme keyring: CLOUD9_GPG_PUBKEY is imported once into a private home,
+# and each thread keeps one Context on it (contexts are not thread-safe)
+_GPG_HOME = None
+_GPG_LOCAL = threading.local()
+_GPG_LOCK = threading.Lock()
+
+def _gpg_home(gpg):
+    """Keyring holding only the trusted key, or None for the user's own"""
+    global _GPG_HOME
+    pubkey = os.getenv("CLOUD9_GPG_PUBKEY")
+    if pubkey is None:
+        return None
+    with _GPG_LOCK:
+        if _GPG_HOME is None:
+            home = tempfile.mkdtemp(prefix="cloud9-gnupg-")
+            atexit.register(shutil.rmtree, home, ignore_errors=True)
+            with gpg.Context(home_dir=home) as ctx:
+                ctx.key_import(Path(pubkey).read_bytes())
+            _GPG_HOME = home
+    return _GPG_HOME
+
+def _gpg_context(gpg):
+    """This thread's gpgme Context, created on first use and kept open"""
+    ctx = getattr(_GPG_LOCAL, "ctx", None)
+    if ctx is None:
+        ctx = gpg.Context(home_dir=_gpg_home(gpg))
+        _GPG_LOCAL.ctx = ctx
+    return ctx
+
+def _verify_in_process(commit_hash: str):
+    """Verify a commit signature via pygit2 + gpgme, without forking git
+    
+    Returns (ok, error), or None when either binding or the repository is
+    unavailable so the caller can fall back to `git verify-commit`
+    """
     try:
-        result = subprocess.run(
-            ["git", "verify-commit", commit_hash, "--verbose"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
+        import pygit2
+        import gpg
+    except ImportError:
+        return None
+    
+    path = pygit2.discover_repository(os.getcwd())
+    if path is None:
+        return None
+    repo = _REPOS.get(path)
+    if repo is None:
+        repo = _REPOS.setdefault(path, pygit2.Repository(path))
+    
+    try:
+        commit = repo.revparse_single(commit_hash).peel(pygit2.Commit)
+    except (KeyError, ValueError) as e:
+        return False, f"cannot resolve commit {commit_hash}: {e}"
+    
+    signature, payload = commit.gpg_signature
+    if signature is None:
+        return False, _GIT_SIG_STATUS["N"]
+    
+    try:
+        _gpg_context(gpg).verify(payload, signature=signature)
+    except gpg.errors.GpgError as e:
+        return False, str(e)
+    return True, None
+
+def _verify_with_git(commit_hash: str):
+    """Verify via `git verify-commit --raw`, classifying GPG status lines
+    
+    Returns (ok, error) like _verify_in_process
+    """
+    result = subprocess.run(
+        ["git", "verify-commit", "--raw", commit_hash],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    tokens = {line.split()[1] for line in result.stderr.splitlines()
+              if line.startswith("[GNUPG:] ") and len(line.split()) > 1}
+    
+    if result.returncode == 0 and "GOODSIG" in tokens:
+        return True, None
+    for token, code in _RAW_SIG_STATUS.items():
+        if token in tokens:
+            return False, _GIT_SIG_STATUS[code]
+    # No GPG status at all: unsigned commit, or git itself failed
+    message = result.stderr.strip()
+    return False, message.splitlines()[-1] if message else _GIT_SIG_STATUS["N"]
+
+def verify_gpg_signature(commit_hash: str, now_iso: str = None) -> dict:
+    """Verify GPG signature on specific commit
+    
+    now_iso: verification timestamp to record; pass the report's so both agree
+    """
+    if now_iso is None:
+        now_iso = _now_iso()
+    
+    outcome = _verify_in_process(commit_hash)
+    if outcome is None:
+        outcome = _verify_with_git(commit_hash)
+    
+    verified, error = outcome
+    if verified:
         return {
             "status": "VERIFIED",
             "commit": commit_hash,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "gpg_output": "[REDACTED FOR PRIVACY]"
         }
-    except subprocess.CalledProcessError as e:
-        return {
-            "status": "FAILED",
-            "error": str(e),
-            "commit": commit_hash
-        }
+    return {
+        "status": "FAILED",
+        "error": error,
+        "commit": commit_hash
+    }
 
-def validate_manifest_integrity(manifest: dict, sensitive: dict) -> bool:
-    """Validate research manifest against known values"""
-    target_au = float(manifest.get("verification_target", "0").replace(" AU", ""))
+# Threads for async callers; verification mostly waits on git/gpg
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+atexit.register(_EXECUTOR.shutdown)
+
+async def verify_gpg_signature_async(commit_hash: str, now_iso: str = None) -> dict:
+    """verify_gpg_signature without blocking the running event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, verify_gpg_signature,
+                                      commit_hash, now_iso)
+
+def _init_verify_worker(gnupg_root: str):
+    """Give each verification worker its own GNUPGHOME
+    
+    Separate keyrings mean separate gpg-agents, so workers do not queue on
+    one agent. The trusted key from CLOUD9_GPG_PUBKEY is imported into each;
+    without it the user's keyring is left in place.
+    """
+    global _REPOS, _GPG_HOME, _GPG_LOCAL
+    # never share libgit2 or gpgme handles across a fork
+    _REPOS = {}
+    _GPG_HOME = None
+    _GPG_LOCAL = threading.local()
     
-    checks = {
-        "threshold_met": target_au >= 0.5229,
+    pubkey = os.getenv("CLOUD9_GPG_PUBKEY")
+    if pubkey is None:
+        return
+    home = tempfile.mkdtemp(dir=gnupg_root)
+    os.environ["GNUPGHOME"] = home
+    subprocess.run(
+        ["gpg", "--batch", "--quiet", "--import", pubkey],
+        capture_output=True,
+        check=True
+    )
+    _GPG_HOME = home  # already holds the key; the gpgme path reuses it
+
+def verify_commits(hashes: list) -> list:
+    """Verify many commits in parallel, one result dict per hash, in order"""
+    if not hashes:
+        return []
+    now_iso = _now_iso()
+    workers = min(len(hashes), os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory(prefix="cloud9-gnupg-") as gnupg_root:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_verify_worker,
+                                 initargs=(gnupg_root,)) as ex:
+            return list(ex.map(verify_gpg_signature, hashes,
+                               [now_iso] * len(hashes)))
+
+def _batch_failed(hashes: list, stderr: str) -> list:
+    """One FAILED result per hash when git itself could not run the batch"""
+    message = stderr.strip()
+    error = message.splitlines()[-1] if message else "git failed"
+    return [{"status": "FAILED", "error": error, "commit": h} for h in hashes]
+
+def verify_commits_batch(hashes: list) -> list:
+    """Verify many commits with two git calls total instead of one per commit
+    
+    `git cat-file --batch-check` resolves every hash (reporting missing ones
+    per line), then one `git log --no-walk` prints each commit's %G? status.
+    """
+    if not hashes:
+        return []
+    now_iso = _now_iso()
+    
+    resolved = subprocess.run(
+        ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+        input="".join(f"{h}^{{commit}}\n" for h in hashes),
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if resolved.returncode != 0:
+        return _batch_failed(hashes, resolved.stderr)
+    full = [line.split(" ", 1)[0] if line.endswith(" commit") else None
+            for line in resolved.stdout.splitlines()]
+    
+    status = {}
+    found = list(dict.fromkeys(f for f in full if f is not None))
+    if found:
+        log = subprocess.run(
+            ["git", "log", "--no-walk=unsorted", "--pretty=format:%H %G?", *found],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if log.returncode != 0:
+            return _batch_failed(hashes, log.stderr)
+        status = dict(line.split(" ", 1) for line in log.stdout.splitlines())
+    
+    results = []
+    for commit_hash, full_hash in zip(hashes, full):
+        code = status.get(full_hash)
+        if code in ("G", "U"):
+            results.append({
+                "status": "VERIFIED",
+                "commit": commit_hash,
+                "timestamp": now_iso,
+                "gpg_output": "[REDACTED FOR PRIVACY]"
+            })
+        else:
+            error = (f"cannot resolve commit {commit_hash}" if full_hash is None
+                     else _GIT_SIG_STATUS.get(code, f"signature status {code}"))
+            results.append({
+                "status": "FAILED",
+                "error": error,
+                "commit": commit_hash
+            })
+    return results
+
+# Minimum verification target, in AU
+_TARGET_AU = 0.5229
+
+def _target_au(manifest: Mapping) -> float:
+    """Numeric verification target; "0.5229 AU" -> 0.5229"""
+    raw = manifest.get("verification_target", "0")
+    return float(raw.partition(" ")[0] or "0")
+
+def _key_valid(sensitive: dict) -> bool:
+    """GPG key id has the 16 hex digits of a long key id"""
+    return len(sensitive["gpg_key_id"].replace(" ", "")) == 16
+
+def _manifest_checks(manifest: Mapping) -> dict:
+    """Checks that depend only on the public manifest"""
+    return {
+        "threshold_met": _target_au(manifest) >= _TARGET_AU,
         "commit_present": len(manifest.get("commit_hash", "")) == 7,
-        "gpg_key_valid": len(sensitive["gpg_key_id"].replace(" ", "")) == 16,
-        "dedication_recorded": len(manifest.get("dedication", [])) > 0
+        "dedication_recorded": len(manifest.get("dedication", ())) > 0
     }
+
+# RESEARCH_MANIFEST is read-only, so its checks are evaluated once
+_CANON_CHECKS = _manifest_checks(RESEARCH_MANIFEST)
+_CANON_VALID = all(_CANON_CHECKS.values())
+
+def is_manifest_valid(manifest: Mapping, sensitive: dict) -> bool:
+    """Pass/fail only; stops at the first failing check"""
+    if manifest is RESEARCH_MANIFEST:
+        return _CANON_VALID and _key_valid(sensitive)
+    return (_target_au(manifest) >= _TARGET_AU
+            and len(manifest.get("commit_hash", "")) == 7
+            and len(manifest.get("dedication", ())) > 0
+            and _key_valid(sensitive))
+
+def manifest_check_details(manifest: Mapping, sensitive: dict) -> Dict[str, bool]:
+    """Every check by name, for the integrity report"""
+    if manifest is RESEARCH_MANIFEST:
+        public = _CANON_CHECKS
+    else:
+        public = _manifest_checks(manifest)
     
+    # Keys in sorted order: the report is serialized without sort_keys
+    return {
+        "commit_present": public["commit_present"],
+        "dedication_recorded": public["dedication_recorded"],
+        "gpg_key_valid": _key_valid(sensitive),
+        "threshold_met": public["threshold_met"]
+    }
+
+def validate_manifest_integrity(manifest: Mapping, sensitive: dict) -> Tuple[bool, Dict[str, bool]]:
+    """Validate research manifest against known values"""
+    checks = manifest_check_details(manifest, sensitive)
     return all(checks.values()), checks
 
+class _HashingWriter(io.RawIOBase):
+    """Binary sink that hashes every byte it forwards to the wrapped file"""
+    
+    def __init__(self, raw, *digests):
+        self._raw = raw
+        self.digests = digests
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, b) -> int:
+        n = self._raw.write(b)
+        written = memoryview(b)[:n]
+        for digest in self.digests:
+            digest.update(written)
+        return n
+
+def _keys_sorted(obj) -> bool:
+    """True when every dict in obj has its keys in sorted order"""
+    if isinstance(obj, dict):
+        keys = list(obj)
+        return keys == sorted(keys) and all(_keys_sorted(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_keys_sorted(v) for v in obj)
+    return True
+
+def _has_floats(obj) -> bool:
+    """True when obj holds a float anywhere (see _write_report)"""
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_floats(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_floats(v) for v in obj)
+    return False
+
+def _write_report(report: dict) -> Tuple[Path, bytes]:
+    """Write 2-space-indented UTF-8 JSON named by its own BLAKE2b hash
+    
+    Keys are written in insertion order; callers build the report with
+    sorted keys so the bytes are canonical.
+    
+    The bytes are hashed as they are written to a temporary file, which is
+    fsynced and atomically renamed once the hash (and so the name) is
+    known; readers never see a partial report. Without orjson the
+    stdlib encoder streams, so a large report is never held in memory whole.
+    Both paths produce the same bytes for strings, ints, bools, None, lists
+    and dicts, but not for floats (json writes 1e-07 and NaN where orjson
+    writes 1e-7 and null), so reports carry numbers that are not ints as
+    preformatted strings.
+    
+    Returns the report path and the full 512-bit BLAKE2b digest that
+    sign_report signs.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    content_digest = hashlib.blake2b()
+    # Paths stay bytes until the user-facing return value. The temporary
+    # name is unique per process and call (O_EXCL guards the rest); 0o644
+    # under the umask gives the same permissions a plain write would.
+    tmp = b"verification_report_%d_%s.tmp" % (os.getpid(), os.urandom(4).hex().encode())
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+                 0o644)
+    try:
+        with open(fd, "wb") as f:
+            sink = _HashingWriter(f, digest, content_digest)
+            if orjson is not None:
+                sink.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with io.TextIOWrapper(io.BufferedWriter(sink),
+                                      encoding="utf-8", newline="\n") as text:
+                    json.dump(report, text, indent=2, ensure_ascii=False)
+            # Data must be on disk before the rename makes it visible
+            f.flush()
+            os.fsync(f.fileno())
+        fname = b"verification_report_" + digest.hexdigest().encode() + b".json"
+        os.replace(tmp, fname)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return Path(os.fsdecode(fname)), content_digest.digest()
+
+# Detached report signature: Ed25519 over the report's BLAKE2b-512 digest
+_SIGNATURE_ALGORITHM = "ed25519-blake2b512"
+
+def _load_signing_key():
+    """Ed25519 key from CLOUD9_REPORT_SIGNING_KEY (base64 32-byte seed)
+    
+    None when the variable is unset or `cryptography` is not installed
+    """
+    seed_b64 = os.getenv("CLOUD9_REPORT_SIGNING_KEY")
+    if seed_b64 is None:
+        return None
+    try:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+    except ImportError:
+        return None
+    return Ed25519PrivateKey.from_private_bytes(base64.b64decode(seed_b64))
+
+def sign_report(output_path: Path, digest: bytes, private_key) -> Path:
+    """Write the detached signature for a report next to it as <report>.sig"""
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+    
+    public = private_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+    envelope = {
+        "algorithm": _SIGNATURE_ALGORITHM,
+        "pubkey_b64": base64.b64encode(public).decode(),
+        "signature_b64": base64.b64encode(private_key.sign(digest)).decode()
+    }
+    sig_path = output_path.with_name(output_path.name + ".sig")
+    sig_path.write_text(json.dumps(envelope, indent=2))
+    return sig_path
+
+def _file_digest(path, factory):
+    """Hash a file without reading it into one bytes object"""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, factory)
+        digest = factory()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest
+
+def verify_report_file(path) -> bool:
+    """Check that a report's contents still match the hash in its file name"""
+    path = Path(path)
+    prefix, suffix = "verification_report_", ".json"
+    if not (path.name.startswith(prefix) and path.name.endswith(suffix)):
+        return False
+    expected = path.name[len(prefix):-len(suffix)]
+    actual = _file_digest(path, lambda: hashlib.blake2b(digest_size=8)).hexdigest()
+    return actual == expected
+
+def verify_report(path, public_key_b64: str = None) -> bool:
+    """Check a report against its .sig sidecar, without gpg
+    
+    public_key_b64: trusted signer key, defaulting to CLOUD9_REPORT_PUBKEY.
+    The key embedded in the sidecar is never trusted, so without either
+    the report is not verified
+    """
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    
+    if public_key_b64 is None:
+        public_key_b64 = os.getenv("CLOUD9_REPORT_PUBKEY")
+        if public_key_b64 is None:
+            return False
+    
+    path = Path(path)
+    try:
+        envelope = json.loads(path.with_name(path.name + ".sig").read_text())
+        if envelope["algorithm"] != _SIGNATURE_ALGORITHM:
+            return False
+        public_key = Ed25519PublicKey.from_public_bytes(
+            base64.b64decode(public_key_b64))
+        signature = base64.b64decode(envelope["signature_b64"])
+        digest = _file_digest(path, hashlib.blake2b)
+        public_key.verify(signature, digest.digest())
+    except (OSError, ValueError, KeyError, TypeError, InvalidSignature):
+        return False
+    return True
+
+# Last report written by generate_integrity_report, keyed on its inputs
+_LAST = {}
+
+def _report_key(sensitive: dict) -> bytes:
+    """Fingerprint of everything a report depends on besides the clock"""
+    material = repr((sorted(RESEARCH_MANIFEST.items()),
+                     sorted(sensitive.items()),
+                     os.getenv("CLOUD9_REPORT_SIGNING_KEY")))
+    return hashlib.blake2b(material.encode(), digest_size=8).digest()
+
+# Static first line of the summary, encoded once
+_BANNER = "\U0001f52c Cloud-9 Research Integrity Report\n".encode()
+
+def _is_utf8(encoding) -> bool:
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except (LookupError, TypeError):
+        return False
+
+def _print_summary(report: dict, sensitive: dict, output_path: Path,
+                   sig_path: Path = None):
+    """Banner bytes straight to a utf-8 binary stream, then one text write"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None and _is_utf8(getattr(sys.stdout, "encoding", None)):
+        sys.stdout.flush()  # keep earlier text output ahead of the banner
+        buffer.write(_BANNER)
+    else:
+        sys.stdout.write(_BANNER.decode())
+    
+    lines = [
+        f"Status: {report['integrity_status']}",
+        f"Target Threshold: {RESEARCH_MANIFEST['verification_target']}",
+        f"GPG Key: {sensitive['gpg_key_id'][:4]}...{sensitive['gpg_key_id'][-4:]}",
+        f"\nDedication Anchors: {', '.join(RESEARCH_MANIFEST['dedication'])}",
+        f"Report saved: {output_path}",
+    ]
+    if sig_path is not None:
+        lines.append(f"Signature saved: {sig_path}")
+    lines.append("\n⚠️  Note: Store verification_report_*.json securely")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _last_report_intact() -> bool:
+    """The memoized report is still on disk, unedited, with its signature"""
+    output_path, sig_path = _LAST["output_path"], _LAST["sig_path"]
+    return (output_path.exists() and verify_report_file(output_path)
+            and (sig_path is None or sig_path.exists()))
+
 def generate_integrity_report():
-    """Generate tamper-evident report of current verification"""
+    """Generate tamper-evident report of current verification
+    
+    While the manifest, environment config and signing key are unchanged
+    and the last report (and its .sig, if signed) is still on disk and
+    matches its hash, that report is returned as is.
+    """
     sensitive = get_sensitive_config()
-    status, details = validate_manifest_integrity(RESEARCH_MANIFEST, sensitive)
+    key = _report_key(sensitive)
+    if _LAST.get("key") == key and _last_report_intact():
+        _print_summary(_LAST["report"], sensitive, _LAST["output_path"], _LAST["sig_path"])
+        return _LAST["report"]
+    
+    now_iso = _now_iso()  # one verification moment per report
+    details = manifest_check_details(RESEARCH_MANIFEST, sensitive)
+    status = all(details.values())
     
+    # Built in canonical (sorted) key order at every level, so serializing
+    # needs no sort_keys pass and the bytes are reproducible
     report = {
-        "verification_time": datetime.now().isoformat(),
-        "manifest": {**RESEARCH_MANIFEST, **sensitive},
-        "integrity_status": "VALID" if status else "COMPROMISED",
         "component_checks": details,
-        "privacy_note": "Sensitive data loaded from environment variables"
+        "integrity_status": "VALID" if status else "COMPROMISED",
+        "manifest": dict(sorted({**RESEARCH_MANIFEST, **sensitive}.items())),
+        "privacy_note": "Sensitive data loaded from environment variables",
+        "verification_time": now_iso
     }
+    assert _keys_sorted(report), "report keys must be in canonical order"
+    assert not _has_floats(report), "report floats must be preformatted strings"
     
-    report_str = json.dumps(RESEARCH_MANIFEST, sort_keys=True)
-    report_hash = hashlib.sha256(report_str.encode()).hexdigest()[:16]
+    # The file name fingerprints exactly the bytes written
+    output_path, digest = _write_report(report)
     
-    output_path = Path(f"verification_report_{report_hash}.json")
-    output_path.write_text(json.dumps(report, indent=2))
+    signing_key = _load_signing_key()
+    sig_path = None
+    if signing_key is not None:
+        sig_path = sign_report(output_path, digest, signing_key)
     
-    print(f"🔬 Cloud-9 Research Integrity Report")
-    print(f"Status: {report['integrity_status']}")
-    print(f"Target Threshold: {RESEARCH_MANIFEST['verification_target']}")
-    print(f"GPG Key: {sensitive['gpg_key_id'][:4]}...{sensitive['gpg_key_id'][-4:]}")
-    print(f"\nDedication Anchors: {', '.join(RESEARCH_MANIFEST['dedication'])}")
-    print(f"Report saved: {output_path}")
-    print(f"\n⚠️  Note: Store verification_report_*.json securely")
+    _LAST.update(key=key, report=report, output_path=output_path, sig_path=sig_path)
+    _print_summary(report, sensitive, output_path, sig_path)
     
     return report
 